@@ -1,99 +1,169 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+
+from gpa_core import LETTER_THRESH, LETTERS, POINTS, THRESH
+from gpa_core import compute_gpa as _compute_gpa, update_cgpa as _update_cgpa
 
 st.set_page_config(page_title="GPA & CGPA Calculator", page_icon="🎓", layout="centered")
 
-st.title("🎓 Semester GPA & CGPA Tool")
-st.write("""
+# --- Cached computations (Streamlit reruns the whole script on every widget change) ---
+compute_gpa = st.cache_data(max_entries=256)(_compute_gpa)
+update_cgpa = st.cache_data(max_entries=64)(_update_cgpa)
+
+def _with_total(values, total=None):
+    """Append a totals cell to a numeric column; a None total is left blank (<NA>)."""
+    values = np.append(values, 0 if total is None else total).astype(values.dtype)
+    mask = np.zeros(values.size, dtype=bool)
+    mask[-1] = total is None
+    if values.dtype.kind == "f":
+        return pd.arrays.FloatingArray(values, mask)
+    return pd.arrays.IntegerArray(values, mask)
+
+@st.cache_data(max_entries=256)
+def build_results_df(names, marks, credits, gps, qp, total_credits, total_points, marks_label="Marks"):
+    """Build the detailed results table (plus a totals row) from per-subject columns."""
+    if not names:
+        return pd.DataFrame()
+
+    # letters come from the exact float64 points: float32 2.3/3.3 sit just below the thresholds
+    letters = LETTERS[np.searchsorted(LETTER_THRESH, gps, side="right")]
+
+    # marks fit in int16, grade points in float32; credits are int32 because the
+    # totals row shares the column and an unbounded grid can push it past int16
+    marks_arr = np.asarray(marks, dtype=np.int16)
+    cred_arr = np.asarray(credits, dtype=np.int32)
+    gps = np.asarray(gps, dtype=np.float32)
+    qp = np.asarray(qp, dtype=np.float32)
+
+    # one pre-typed array per field (the totals row is the last cell of each column);
+    # copy=False hands them to pandas as-is instead of copying into consolidated blocks
+    return pd.DataFrame({
+        "Subject": np.append(names, "Total"),
+        marks_label: _with_total(marks_arr),
+        "Credit Hours": _with_total(cred_arr, int(total_credits)),
+        "Grade Point": _with_total(gps),
+        "Letter": np.append(letters, ""),
+        "Quality Points": _with_total(qp, total_points),
+    }, copy=False)
+
+def style_results(df):
+    """Two-decimal display for point columns; blank totals-row cells render empty."""
+    if df.empty:
+        return df
+    return df.style.format({"Grade Point": "{:.2f}", "Quality Points": "{:.2f}"}, na_rep="")
+
+# --- Constant page assets, built once per process and shared across reruns/sessions ---
+@st.cache_resource
+def _const_assets():
+    lower = np.concatenate(([0], THRESH))
+    upper = np.concatenate((THRESH - 1, [100]))
+    return {
+        "banner": """
 Tell me your **marks for each subject** for the current semester to compute your **GPA**.
 Optionally provide your **previous CGPA and total credit hours** to compute an updated **CGPA**.
-""")
-
-# --- Define function to convert marks to grade points ---
-def marks_to_gpa(marks):
-    if marks >= 85:
-        return 4.0
-    elif marks >= 80:
-        return 3.7
-    elif marks >= 75:
-        return 3.3
-    elif marks >= 70:
-        return 3.0
-    elif marks >= 65:
-        return 2.7
-    elif marks >= 61:
-        return 2.3
-    elif marks >= 58:
-        return 2.0
-    elif marks >= 55:
-        return 1.7
-    elif marks >= 50:
-        return 1.0
-    else:
-        return 0.0
-
-# small helper to show letter grade for a grade point
-def gpa_to_letter(gpa):
-    if gpa >= 3.7:
-        return "A"
-    if gpa >= 3.3:
-        return "A-"
-    if gpa >= 3.0:
-        return "B+"
-    if gpa >= 2.7:
-        return "B"
-    if gpa >= 2.3:
-        return "B-"
-    if gpa >= 2.0:
-        return "C+"
-    if gpa >= 1.7:
-        return "C"
-    if gpa >= 1.0:
-        return "D"
-    return "F"
+""",
+        "thresh_df": pd.DataFrame({
+            "Marks": [f"{lo}–{hi}" for lo, hi in zip(lower, upper)][::-1],
+            "Grade Point": POINTS[::-1],
+            "Letter": LETTERS[np.searchsorted(LETTER_THRESH, POINTS, side="right")][::-1],
+        }),
+    }
+
+# --- Editor grid helpers ---
+def subject_column_config(marks_label="Marks"):
+    return {
+        "Subject": st.column_config.TextColumn("Subject", default=""),
+        marks_label: st.column_config.NumberColumn(marks_label, min_value=0, max_value=100, step=1, default=75),
+        "Credit Hours": st.column_config.NumberColumn("Credit Hours", min_value=1, max_value=5, step=1, default=3),
+    }
+
+@st.cache_data
+def _default_subjects_df():
+    """Starting grid: five unnamed subjects at 75 marks and 3 credit hours."""
+    return pd.DataFrame({
+        "Subject": [""] * 5,
+        "Marks": [75] * 5,
+        "Credit Hours": [3] * 5,
+    })
+
+@st.cache_data
+def _empty_projection_df():
+    return pd.DataFrame({
+        "Subject": pd.Series(dtype="str"),
+        "Expected Marks": pd.Series(dtype="int"),
+        "Credit Hours": pd.Series(dtype="int"),
+    })
+
+def _numeric_column(col):
+    """Coerce a whole grid column to floats once; blank or invalid cells become NaN."""
+    return pd.to_numeric(col, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+def editor_rows(df, fallback, marks_label="Marks"):
+    """Read (names, marks, credits) tuples out of an edited subjects grid.
+
+    Rows with blank marks or credits are left out rather than counted as zeros.
+    """
+    marks = _numeric_column(df[marks_label])
+    credits = _numeric_column(df["Credit Hours"])
+    keep = ~(np.isnan(marks) | np.isnan(credits))
+    names = tuple(
+        name if isinstance(name, str) and name else f"{fallback} {i+1}"
+        for i, (name, kept) in enumerate(zip(df["Subject"], keep)) if kept
+    )
+    return names, tuple(marks[keep].astype(np.int64).tolist()), tuple(credits[keep].astype(np.int64).tolist())
+
+assets = _const_assets()
+
+st.title("🎓 Semester GPA & CGPA Tool")
+st.markdown(assets["banner"])
+with st.expander("Grading scale"):
+    st.dataframe(assets["thresh_df"], hide_index=True, use_container_width=True)
 
 # --- Input section ---
 st.header("📘 Current Semester — Enter Marks")
 
-num_subjects = st.number_input("Number of subjects this semester:", min_value=1, max_value=15, value=5, step=1)
-
-subjects = []
-total_points = 0.0
-total_credits = 0
+if "subjects_df" not in st.session_state:
+    st.session_state["subjects_df"] = _default_subjects_df()
 
 st.write("### Enter subject name, marks and credit hours for each subject")
-
-for i in range(num_subjects):
-    col1, col2, col3 = st.columns([2, 1, 1])
-    with col1:
-        subject = st.text_input(f"Subject {i+1} name:", key=f"sub_{i}")
-    with col2:
-        marks = st.number_input(f"Marks ({subject or f'Subject {i+1}'})", 0, 100, 75, key=f"marks_{i}")
-    with col3:
-        credits = st.number_input(f"Credit hours", 1, 5, 3, key=f"credits_{i}")
-
-    gpa = marks_to_gpa(marks)
-    subjects.append({
-        "Subject": subject or f"Subject {i+1}",
-        "Marks": marks,
-        "Credit Hours": int(credits),
-        "Grade Point": round(gpa, 2),
-        "Letter": gpa_to_letter(gpa),
-        "Quality Points": round(gpa * credits, 2)
-    })
-    total_points += gpa * credits
-    total_credits += int(credits)
+st.caption("Add or remove rows directly in the grid, then press **Calculate GPA**.")
+
+# edits are batched by the form: the script only sees them (and recomputes) on submit
+with st.form("semester_form"):
+    edited = st.data_editor(
+        st.session_state["subjects_df"],
+        column_config=subject_column_config(),
+        num_rows="dynamic",
+        use_container_width=True,
+        key="subjects_editor",
+    )
+    st.form_submit_button("Calculate GPA")
 
 # --- GPA Calculation ---
-if total_credits > 0:
-    current_gpa = total_points / total_credits
-else:
-    current_gpa = 0.0
+names, marks_list, credits_list = editor_rows(edited, "Subject")
+
+# only recompute when the subject inputs actually changed (e.g. not for CGPA edits)
+inputs_key = hash((names, marks_list, credits_list))
+if st.session_state.get("inputs_key") != inputs_key:
+    gps, qp, total_points, total_credits, current_gpa = compute_gpa(marks_list, credits_list)
+    st.session_state["results"] = {
+        "total_points": total_points,
+        "total_credits": total_credits,
+        "current_gpa": current_gpa,
+        "df_totals": build_results_df(names, marks_list, credits_list, gps, qp, total_credits, total_points),
+    }
+    st.session_state["inputs_key"] = inputs_key
+
+results = st.session_state["results"]
+total_points = results["total_points"]
+total_credits = results["total_credits"]
+current_gpa = results["current_gpa"]
 
 # --- Display current GPA ---
 st.subheader("📊 Current Semester GPA")
 st.write(f"**Your GPA for this semester:** `{current_gpa:.2f}`")
-st.caption(f"Total credit hours this semester: {int(total_credits)}  •  Total quality points: {round(total_points,2)}")
+st.caption(f"Total credit hours this semester: {int(total_credits)}  •  Total quality points: {total_points:.2f}")
 
 # --- Previous CGPA Section ---
 st.header("📚 CGPA Update (Optional)")
@@ -101,39 +171,20 @@ st.write("If you have previous CGPA and total credit hours, enter them below to
 
 col1, col2 = st.columns(2)
 with col1:
-    prev_cgpa = st.number_input("Previous CGPA", 0.0, 4.0, 0.0, step=0.01)
+    prev_cgpa = st.number_input("Previous CGPA", 0.0, 4.0, 0.0, step=0.01, key="prev_cgpa")
 with col2:
-    prev_credits = st.number_input("Total Credit Hours Completed Previously", 0, 200, 0, step=1)
+    prev_credits = st.number_input("Total Credit Hours Completed Previously", 0, 200, 0, step=1, key="prev_credits")
 
 # --- CGPA Calculation ---
-if prev_credits > 0:
-    new_cgpa = ((prev_cgpa * prev_credits) + (current_gpa * total_credits)) / (prev_credits + total_credits)
-else:
-    new_cgpa = current_gpa
+new_cgpa = update_cgpa(prev_cgpa, prev_credits, current_gpa, total_credits)
 
 st.subheader("🎯 Updated CGPA")
 st.write(f"**Your updated CGPA:** `{new_cgpa:.2f}`")
 st.caption(f"Combined total credits (previous + current): {int(prev_credits + total_credits)}")
 
 # --- Show detailed table ---
-df = pd.DataFrame(subjects)
-
-# Add totals row for convenience using pd.concat (safe for modern pandas)
-if not df.empty:
-    totals = {
-        "Subject": "Total",
-        "Marks": "",
-        "Credit Hours": int(total_credits),
-        "Grade Point": "",
-        "Letter": "",
-        "Quality Points": round(total_points, 2)
-    }
-    df_totals = pd.concat([df, pd.DataFrame([totals])], ignore_index=True)
-else:
-    df_totals = df
-
 st.write("### Detailed Results")
-st.dataframe(df_totals, use_container_width=True)
+st.dataframe(style_results(results["df_totals"]), use_container_width=True)
 
 st.success("✅ GPA and CGPA calculated successfully!")
 
@@ -142,75 +193,53 @@ st.markdown("---")
 st.header("🔮 Estimate: Next Semester Projection")
 st.write("Optionally estimate your **next semester GPA** and **projected CGPA** by entering planned subjects and expected marks.")
 
-proj_subjects = st.number_input("Number of planned subjects for next semester:", min_value=0, max_value=15, value=0, step=1, key="proj_count")
-
-proj_list = []
-proj_total_points = 0.0
-proj_total_credits = 0
-
-if proj_subjects > 0:
-    st.write("Enter expected marks and credits for each planned subject:")
-    for k in range(proj_subjects):
-        pcol1, pcol2 = st.columns([3, 1])
-        with pcol1:
-            pname = st.text_input(f"Planned Subject {k+1} name:", key=f"p_sub_{k}")
-        with pcol2:
-            pmarks = st.number_input(f"Marks ({pname or f'Planned {k+1}'})", 0, 100, 75, key=f"p_marks_{k}")
-        pcredits = st.number_input(f"Credit hours for {pname or f'Planned {k+1}'}", 1, 5, 3, key=f"p_credits_{k}")
-
-        pgpa = marks_to_gpa(pmarks)
-        proj_list.append({
-            "Subject": pname or f"Planned {k+1}",
-            "Expected Marks": pmarks,
-            "Credit Hours": int(pcredits),
-            "Grade Point": round(pgpa, 2),
-            "Letter": gpa_to_letter(pgpa),
-            "Quality Points": round(pgpa * pcredits, 2)
-        })
-        proj_total_points += pgpa * pcredits
-        proj_total_credits += int(pcredits)
-
-    if proj_total_credits > 0:
-        projected_sem_gpa = proj_total_points / proj_total_credits
-    else:
-        projected_sem_gpa = 0.0
+if "proj_df" not in st.session_state:
+    st.session_state["proj_df"] = _empty_projection_df()
+
+st.write("Add a row for each planned subject with its expected marks and credits:")
+with st.form("projection_form"):
+    proj_edited = st.data_editor(
+        st.session_state["proj_df"],
+        column_config=subject_column_config("Expected Marks"),
+        num_rows="dynamic",
+        use_container_width=True,
+        key="proj_editor",
+    )
+    st.form_submit_button("Estimate Projection")
+
+pnames, pmarks_list, pcredits_list = editor_rows(proj_edited, "Planned", marks_label="Expected Marks")
+
+if pnames:
+    pgps, pqp, proj_total_points, proj_total_credits, projected_sem_gpa = compute_gpa(pmarks_list, pcredits_list)
 
     st.subheader("📈 Projected Next Semester GPA")
     st.write(f"**Projected GPA for next semester:** `{projected_sem_gpa:.2f}`")
-    st.caption(f"Planned credits: {int(proj_total_credits)}  •  Planned total quality points: {round(proj_total_points,2)}")
+    st.caption(f"Planned credits: {int(proj_total_credits)}  •  Planned total quality points: {proj_total_points:.2f}")
 
     # Projected CGPA after next semester (use current combined credits as base)
     # Base CGPA uses prev_cgpa & prev_credits plus current semester already done
     base_total_credits = prev_credits + total_credits
     base_cgpa = new_cgpa  # this already includes current semester
 
-    if (base_total_credits + proj_total_credits) > 0:
-        combined_quality = base_cgpa * base_total_credits + projected_sem_gpa * proj_total_credits
-        projected_overall_cgpa = combined_quality / (base_total_credits + proj_total_credits)
-    else:
-        projected_overall_cgpa = projected_sem_gpa
+    projected_overall_cgpa = update_cgpa(base_cgpa, base_total_credits, projected_sem_gpa, proj_total_credits)
 
     st.subheader("🎯 Projected CGPA After Next Semester")
     st.write(f"**Projected CGPA after adding next semester:** `{projected_overall_cgpa:.2f}`")
     st.caption(f"Projected combined credits: {int(base_total_credits + proj_total_credits)}")
 
-    # show projection details table using pd.concat
-    pdf = pd.DataFrame(proj_list)
-    if not pdf.empty:
-        p_totals = {
-            "Subject": "Total",
-            "Expected Marks": "",
-            "Credit Hours": int(proj_total_credits),
-            "Grade Point": "",
-            "Letter": "",
-            "Quality Points": round(proj_total_points, 2)
-        }
-        pdf = pd.concat([pdf, pd.DataFrame([p_totals])], ignore_index=True)
+    # show projection details table, rebuilt only when the planned subjects change
+    proj_key = hash((pnames, pmarks_list, pcredits_list))
+    if st.session_state.get("proj_key") != proj_key:
+        st.session_state["pdf"] = build_results_df(
+            pnames, pmarks_list, pcredits_list, pgps, pqp, proj_total_credits, proj_total_points,
+            marks_label="Expected Marks",
+        )
+        st.session_state["proj_key"] = proj_key
     st.write("### Planned Semester Details")
-    st.dataframe(pdf, use_container_width=True)
+    st.dataframe(style_results(st.session_state["pdf"]), use_container_width=True)
 else:
     st.info("No planned subjects entered. Add planned subjects above to estimate next semester results.")
 
 # --- Small suggestions (non-structural) ---
 st.markdown("---")
-st.caption("Suggestions: You can (1) change the grade scale in `marks_to_gpa`, (2) allow entering grade points directly, (3) export results to CSV, or (4) add visual trend charts. These changes are optional and don't alter the main input/output flow.")
+st.caption("Suggestions: You can (1) change the grade scale in `gpa_core.py` (`THRESH`/`POINTS`), (2) allow entering grade points directly, (3) export results to CSV, or (4) add visual trend charts. These changes are optional and don't alter the main input/output flow.")
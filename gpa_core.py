@@ -0,0 +1,51 @@
+"""Grade scale and GPA/CGPA arithmetic shared by the Streamlit app in gpa.py.
+
+Kept free of Streamlit so it is imported (and its constant tables built) once
+per process instead of being re-executed on every script rerun.
+"""
+import numpy as np
+
+# --- Grade scale: the single definition used everywhere ---
+# a mark reaching THRESH[i - 1] (but not THRESH[i]) earns POINTS[i]
+THRESH = np.array([50, 55, 58, 61, 65, 70, 75, 80, 85])
+POINTS = np.array([0.0, 1.0, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0])
+
+# letter bands for grade points, read the same way
+LETTER_THRESH = np.array([1.0, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7])
+LETTERS = np.array(["F", "D", "C", "C+", "B-", "B", "B+", "A-", "A"])
+
+# scalar helpers, derived from the tables above
+def marks_to_gpa(marks):
+    return float(POINTS[np.searchsorted(THRESH, marks, side="right")])
+
+def gpa_to_letter(gpa):
+    return str(LETTERS[np.searchsorted(LETTER_THRESH, gpa, side="right")])
+
+# --- GPA computations (cached by the Streamlit app, see gpa.py) ---
+def _compute_all(marks, credits):
+    """Grade points, quality points and both totals for float64 arrays, in one NumPy pass."""
+    # bucket index = how many of the fixed thresholds each mark reaches (branchless compare-and-count)
+    idx = np.less_equal.outer(THRESH, marks).sum(axis=0)
+    gps = POINTS[idx]
+    qp = gps * credits
+    return gps, qp, qp.sum(), credits.sum()
+
+def compute_gpa(marks, credits):
+    """Return (grade points, quality points, total points, total credits, GPA) for tuples of marks and credits."""
+    marks_arr = np.asarray(marks, dtype=np.float64)
+    cred_arr = np.asarray(credits, dtype=np.float64)
+    gps, qp, total_points, total_credits = _compute_all(marks_arr, cred_arr)
+    total_points = float(total_points)
+    total_credits = int(total_credits)
+    # _compute_all has no division in it; this is the one scalar divide
+    if total_credits > 0:
+        sem_gpa = total_points / total_credits
+    else:
+        sem_gpa = 0.0
+    return gps, qp, total_points, total_credits, sem_gpa
+
+def update_cgpa(prev_cgpa, prev_credits, sem_gpa, sem_credits):
+    """Combine a previous CGPA with a semester GPA, weighted by credit hours."""
+    if prev_credits > 0:
+        return ((prev_cgpa * prev_credits) + (sem_gpa * sem_credits)) / (prev_credits + sem_credits)
+    return sem_gpa